@@ -9,17 +9,37 @@ An easy plotting GUI for Python.
 
 
 # %% IMPORTS AND DECLARATIONS
+# Built-in imports
+from importlib import import_module
+
 # Import globals
-from ._globals import *
+# These are imported explicitly, as pyflakes cannot distinguish the lazily
+# imported subpackages in __all__ from names provided by a star import
+from ._globals import (APP_NAME, CONFIG_DIR, CONFIG_NAME, DIR_PATH,
+                       FLOAT_TYPES, INT_TYPES, STR_TYPES)
 
 # Import base modules and definitions
 from .__version__ import __version__
 
-# Import subpackages
-from . import app, config, layouts, plugins, utils, widgets
+# Subpackages that are imported lazily on first attribute access (PEP 562)
+# This keeps all heavy modules off the startup path of the application
+_SUBPACKAGES = ('app', 'config', 'layouts', 'plugins', 'utils', 'widgets')
 
 # All declaration
 __all__ = ['app', 'config', 'layouts', 'plugins', 'utils', 'widgets']
 
 # Author declaration
 __author__ = "Ellert van der Velden (@1313e)"
+
+
+# %% LAZY IMPORTS
+# This function imports subpackages lazily on first attribute access
+def __getattr__(name):
+    # If name is a subpackage, import and return it
+    if name in _SUBPACKAGES:
+        mod = import_module(f'.{name}', __name__)
+        globals()[name] = mod
+        return(mod)
+
+    # If name is not a subpackage, raise error
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,8 +10,8 @@ available.
 
 
 # %% IMPORTS
-# Package imports
-import numpy as np
+# Built-in imports
+from numbers import Integral, Real
 from os import path
 
 # All declaration
@@ -27,6 +27,8 @@ DIR_PATH = path.abspath(path.dirname(__file__))     # Path to GUI directory
 
 
 # %% TYPE GLOBALS
-INT_TYPES = (int, np.integer)
-FLOAT_TYPES = (float, np.floating, *INT_TYPES)
+# The abstract base classes cover the NumPy scalar types as well, which are
+# registered with them, without pulling NumPy into the import graph
+INT_TYPES = (int, Integral)
+FLOAT_TYPES = (float, Real, *INT_TYPES)
 STR_TYPES = (str,)
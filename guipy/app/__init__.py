@@ -9,14 +9,40 @@ Contains the core application function for using *GuiPy*.
 
 
 # %% IMPORTS
-# Import base modules
-from . import main_window
-from .main_window import *
-from .start import main
+# Built-in imports
+from importlib import import_module
+
+# Submodules that are imported lazily on first attribute access (PEP 562)
+# This keeps the main window and all of its heavy dependencies unparsed
+# until they are actually used
+_SUBMODULES = ('start', 'main_window')
 
 # All declaration
-__all__ = ['main_window', 'main']
-__all__.extend(main_window.__all__)
+# Kept static, so it can be read without executing any submodule
+__all__ = ['main_window', 'start', 'main', 'MainWindow']
 
 # Author declaration
 __author__ = "Ellert van der Velden (@1313e)"
+
+
+# %% LAZY IMPORTS
+# This function imports submodules lazily on first attribute access
+def __getattr__(name):
+    # Loop over all submodules and check if one of them provides name
+    for sub in _SUBMODULES:
+        # Import this submodule
+        mod = import_module(f'.{sub}', __name__)
+
+        # If this submodule is the requested attribute itself, return it
+        if sub == name:
+            globals()[name] = mod
+            return(mod)
+
+        # If this submodule provides the requested attribute, return that
+        if name in getattr(mod, '__all__', ()):
+            value = getattr(mod, name)
+            globals()[name] = value
+            return(value)
+
+    # If no submodule provides name, raise error
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -21,7 +21,7 @@ from qtpy import QtCore as QC, QtGui as QG, QtWidgets as QW
 
 # GuiPy imports
 from guipy import __version__, APP_NAME, STR_TYPES
-from guipy import plugins as GP, widgets as GW
+from guipy import widgets as GW
 from guipy.config import CONFIG
 from guipy.widgets import create_exception_handler
 
@@ -44,6 +44,27 @@ class MainWindow(GW.QMainWindow):
     # Signals
     exception = QC.Signal()
 
+    # Create the text for the 'about' dialog
+    # As all of its fields are process-wide constants, it is built only once
+    # at class construction instead of on every dialog open
+    ABOUT_TEXT = dedent(r"""
+        <b><a href="{github}">{name}</a> v{version}</b><br>
+        Copyright &copy; 2019-2020 Ellert van der Velden<br>
+        Distributed under the
+        <a href="{github}/raw/master/LICENSE">BSD-3 License</a>.<br>
+        <br>
+        {os_name} {os_release} | Python {python_version} {memsize}-bit |
+        Qt {Qt_version} | PyQt5 {PyQt5_version}
+        """.format(name=APP_NAME,
+                   version=__version__,
+                   github="https://github.com/1313e/GuiPy",
+                   os_name=platform.system(),
+                   os_release=platform.release(),
+                   python_version=platform.python_version(),
+                   memsize=calcsize('P')*8,
+                   Qt_version=qtpy.QT_VERSION,
+                   PyQt5_version=qtpy.PYQT_VERSION))
+
     # Initialize MainWindow class
     def __init__(self, *args, **kwargs):
         """
@@ -106,9 +127,17 @@ class MainWindow(GW.QMainWindow):
     # Override closeEvent to automatically close all plugins
     def closeEvent(self, *args, **kwargs):
         # Close all plugins in plugins dict
-        for plugin in self.plugins.values():
+        # Materialize the values first, as closing a plugin may modify the
+        # plugins dict during iteration
+        for plugin in list(self.plugins.values()):
             plugin.close()
 
+        # Drop all registry references, such that the plugins, menus and
+        # toolbars can be garbage collected once Qt destroys this window
+        self.plugins.clear()
+        self.menus.clear()
+        self.toolbars.clear()
+
         # Call super event
         super().closeEvent(*args, **kwargs)
 
@@ -158,38 +187,20 @@ class MainWindow(GW.QMainWindow):
 
         """
 
-        # TOP-LEVEL MENUS
-        # Make empty dict of top-level menus and actions
+        # Make empty dict of top-level menus
         self.menus = {}
-        actions = {None: []}
-
-        # Create file menu
-        actions[None].append(GW.QMenu('File', '&File'))
-        actions['File'] = []
-
-        # Create view menu
-        actions[None].append(GW.QMenu('View', '&View'))
-        actions['View'] = []
-
-        # Create help menu
-        actions[None].append(GW.QMenu('Help', '&Help'))
-        actions['Help'] = []
-
-        # SUBMENUS
-        # Add a New menu to file menu
-        actions['File'].append(GW.QMenu('New', '&New...'))
 
-        # Add a separator to file menu
-        actions['File'].append(None)
-
-        # Add a docks menu to view menu
-        actions['View'].append(GW.QMenu('Docks', '&Docks'))
-
-        # Add a separator to view menu
-        actions['View'].append(None)
-
-        # Add a toolbars menu to view menu
-        actions['View'].append(GW.QMenu('Toolbars', '&Toolbars'))
+        # Construct the dict of all top-level menus and their submenus at once
+        actions = {
+            None: [GW.QMenu('File', '&File'),
+                   GW.QMenu('View', '&View'),
+                   GW.QMenu('Help', '&Help')],
+            'File': [GW.QMenu('New', '&New...'),
+                     None],
+            'View': [GW.QMenu('Docks', '&Docks'),
+                     None,
+                     GW.QMenu('Toolbars', '&Toolbars')],
+            'Help': []}
 
         # Add all menus and actions
         self.add_menu_actions(actions)
@@ -293,7 +304,9 @@ class MainWindow(GW.QMainWindow):
         actions['Help'].append(aboutqt_act)
 
         # Add all actions to the top-level menu
-        self.add_menu_actions(actions)
+        # These are deferred like the plugin actions added before them, such
+        # that the relative order of all actions in a menu is preserved
+        self.defer_menu_actions(actions)
 
     # This function adds all plugins to the main window
     def add_plugins(self):
@@ -302,6 +315,10 @@ class MainWindow(GW.QMainWindow):
 
         """
 
+        # Import the plugins subpackage now that the main window exists
+        # Deferring this import keeps the plugin subtree off the startup path
+        from guipy import plugins as GP
+
         # Initialize empty dict with plugins
         self.plugins = {}
 
@@ -309,18 +326,32 @@ class MainWindow(GW.QMainWindow):
         self.add_plugin(GP.DataTable)
         self.add_plugin(GP.Figure)
 
+    # This function returns the plugin with the provided title
+    def get_plugin(self, title):
+        """
+        Returns the plugin with the provided `title` or *None* if it does not
+        exist.
+
+        """
+
+        # Return the plugin with this title if it exists
+        return(self.plugins.get(title))
+
     # This function adds a plugin to the main window
-    def add_plugin(self, plugin_class, **kwargs):
+    def add_plugin(self, plugin_class, dock=True, **kwargs):
         """
         Initializes a provided `plugin_class` using its requirements and the
         given `kwargs`, adds it as a plugin to this main window and returns it.
-        If `plugin_class` is associated with a widget, it will be added as a
-        dock widget to this main window as well.
+        If `plugin_class` is associated with a widget and `dock` is *True*, it
+        will be added as a dock widget to this main window as well.
 
         """
 
+        # Import the plugins subpackage for its base plugin definitions
+        from guipy import plugins as GP
+
         # Obtain all the plugin requirements of the provided plugin_class
-        req_plugins = {req: self.plugins.get(req)
+        req_plugins = {req: self.get_plugin(req)
                        for req in plugin_class.REQ_PLUGINS}
 
         # Initialize provided plugin_class
@@ -331,7 +362,9 @@ class MainWindow(GW.QMainWindow):
         self.plugins[plugin_obj.TITLE] = plugin_obj
 
         # Add all menu actions of this plugin_obj to the proper menus
-        self.add_menu_actions(plugin_obj.MENU_ACTIONS)
+        # This is deferred until the target menus are first shown, which keeps
+        # the registration cost out of the start-up path
+        self.defer_menu_actions(plugin_obj.MENU_ACTIONS)
 
         # Add all toolbars of this plugin_obj to the main window
         for toolbar in plugin_obj.TOOLBARS:
@@ -345,7 +378,7 @@ class MainWindow(GW.QMainWindow):
             self.statusbar.addPermanentWidget(widget)
 
         # Check if this plugin_obj is an instance of BasePluginWidget
-        if isinstance(plugin_obj, GP.BasePluginWidget):
+        if dock and isinstance(plugin_obj, GP.BasePluginWidget):
             # If so, add it as a dock widget as well
             self.add_dockwidget(plugin_obj)
 
@@ -360,7 +393,7 @@ class MainWindow(GW.QMainWindow):
         """
 
         # Create a dock widget object
-        dock_widget = GW.BaseDockWidget(plugin_obj.TITLE, self)
+        dock_widget = GW.BaseDockWidget(plugin_obj.title, self)
 
         # Add provided plugin as a widget to it
         dock_widget.setWidget(plugin_obj)
@@ -411,24 +444,137 @@ class MainWindow(GW.QMainWindow):
             else:
                 menu = self.menus[menu_name]
 
+            # Initialize empty batch of consecutive actions
+            batch = []
+
+            # Check whether the last element in this menu is a separator
+            # Skipping redundant separators below avoids allocating a full
+            # QAction and an extra layout row for every orphaned one
+            menu_actions = menu.actions()
+            last_was_sep = (bool(menu_actions) and
+                            menu_actions[-1].isSeparator())
+
+            # Block all signals emitted by the menu while adding in bulk
+            blocked = menu.blockSignals(True)
+
             # Loop over all actions that must be added to this menu
             for action in actions:
-                # If action is None, add a menu separator
+                # If action is an action, add it to the current batch
+                if isinstance(action, QW.QAction):
+                    batch.append(action)
+                    last_was_sep = False
+                    continue
+
+                # Else, flush the current batch of actions first
+                if batch:
+                    menu.addActions(batch)
+                    batch = []
+
+                # If action is None, add a menu separator if needed
                 if action is None:
-                    menu.addSeparator()
+                    if not last_was_sep:
+                        menu.addSeparator()
+                        last_was_sep = True
                 # Else, if action is a menu, add a new menu
                 elif isinstance(action, GW.QMenu):
                     self.addMenu(action, menu)
+                    last_was_sep = False
                 # Else, if action is a string, add a new section
                 elif isinstance(action, STR_TYPES):
                     menu.addSection(action)
-                # Else, if action is an action, add a new action
-                elif isinstance(action, QW.QAction):
-                    menu.addAction(action)
+                    last_was_sep = False
                 # Else, set provided function as the default action
                 else:
                     menu.menuAction().triggered.connect(action)
 
+            # Flush the final batch of actions
+            if batch:
+                menu.addActions(batch)
+
+            # No longer block signals (unless they were blocked before)
+            menu.blockSignals(blocked)
+
+    # This function defers adding menu actions until their menu first shows
+    def defer_menu_actions(self, actions_dict):
+        """
+        Defers adding all menu actions defined in the provided `actions_dict`
+        until the menu they target is about to be shown for the first time.
+
+        This moves the cost of registering plugin actions out of the start-up
+        path and into the first interaction with the menu itself.
+        The deferred actions are registered on the main window until their
+        menu is populated, such that their shortcuts are active immediately.
+
+        Parameters
+        ----------
+        actions_dict : dict of lists
+            Dict containing the actions that need to be added to what menu.
+            See :meth:`~add_menu_actions` for its formatting.
+
+        """
+
+        # Loop over all menus in actions_dict
+        for menu_name, actions in actions_dict.items():
+            # Obtain the corresponding menu if it exists already
+            menu = self.menus.get(menu_name)
+
+            # If it does not exist yet, add these actions immediately
+            if menu is None:
+                self.add_menu_actions({menu_name: actions})
+                continue
+
+            # Gather all QActions among the deferred actions, including those
+            # in submenus, and register them on the main window
+            # This keeps their shortcuts active while the menu insertion
+            # itself is deferred
+            deferred_acts = self._get_menu_actions(actions)
+            self.addActions(deferred_acts)
+
+            # Create a one-shot slot that adds these actions on first show
+            def create_deferred_slot(menu=menu, menu_name=menu_name,
+                                     actions=actions,
+                                     deferred_acts=deferred_acts):
+                def add_deferred_actions():
+                    # Make sure this slot can solely be triggered once
+                    menu.aboutToShow.disconnect(add_deferred_actions)
+
+                    # Remove the deferred actions from the main window again,
+                    # as their menu will take over their shortcuts
+                    for act in deferred_acts:
+                        self.removeAction(act)
+
+                    # Add all deferred actions to this menu
+                    self.add_menu_actions({menu_name: actions})
+                return(add_deferred_actions)
+
+            # Connect this slot to the aboutToShow signal of this menu
+            menu.aboutToShow.connect(create_deferred_slot())
+
+    # This function gathers all QActions found in a list of menu actions
+    def _get_menu_actions(self, actions):
+        """
+        Returns a list of all :obj:`~PyQt5.QtWidgets.QAction` objects found in
+        the provided list of menu `actions`, descending into any submenus.
+
+        Separators (*None*) and sections (str) are skipped.
+
+        """
+
+        # Initialize list of found actions
+        acts = []
+
+        # Loop over all actions
+        for action in actions:
+            # If action is a menu, gather the actions it contains
+            if isinstance(action, GW.QMenu):
+                acts.extend(self._get_menu_actions(action.actions()))
+            # Else, if action is a QAction, add it to the list
+            elif isinstance(action, QW.QAction):
+                acts.append(action)
+
+        # Return acts
+        return(acts)
+
     # This function adds all actions defined in a dict to the proper toolbars
     def add_toolbar_actions(self, actions_dict):
         """
@@ -463,8 +609,24 @@ class MainWindow(GW.QMainWindow):
             # Obtain the corresponding toolbar
             toolbar = self.toolbars[toolbar_name]
 
+            # Initialize empty batch of consecutive actions
+            batch = []
+
+            # Block all signals emitted by the toolbar while adding in bulk
+            blocked = toolbar.blockSignals(True)
+
             # Loop over all actions that must be added to this toolbar
             for action in actions:
+                # If action is an action, add it to the current batch
+                if isinstance(action, QW.QAction):
+                    batch.append(action)
+                    continue
+
+                # Else, flush the current batch of actions first
+                if batch:
+                    toolbar.addActions(batch)
+                    batch = []
+
                 # If action is None, add a toolbar separator
                 if action is None:
                     toolbar.addSeparator()
@@ -474,9 +636,13 @@ class MainWindow(GW.QMainWindow):
                 # Else, if action is a widget, add a new widget
                 elif isinstance(action, QW.QWidget):
                     toolbar.addWidget(action)
-                # Else, add the action to the toolbar
-                else:
-                    toolbar.addAction(action)
+
+            # Flush the final batch of actions
+            if batch:
+                toolbar.addActions(batch)
+
+            # No longer block signals (unless they were blocked before)
+            toolbar.blockSignals(blocked)
 
     # This function creates a message box with the 'about' information
     @QC.Slot()
@@ -486,27 +652,5 @@ class MainWindow(GW.QMainWindow):
 
         """
 
-        # Make shortcuts for certain links
-        github_repo = "https://github.com/1313e/GuiPy"
-
-        # Create the text for the 'about' dialog
-        text = dedent(r"""
-            <b><a href="{github}">{name}</a> v{version}</b><br>
-            Copyright &copy; 2019-2020 Ellert van der Velden<br>
-            Distributed under the
-            <a href="{github}/raw/master/LICENSE">BSD-3 License</a>.<br>
-            <br>
-            {os_name} {os_release} | Python {python_version} {memsize}-bit |
-            Qt {Qt_version} | PyQt5 {PyQt5_version}
-            """.format(name=APP_NAME,
-                       version=__version__,
-                       github=github_repo,
-                       os_name=platform.system(),
-                       os_release=platform.release(),
-                       python_version=platform.python_version(),
-                       memsize=calcsize('P')*8,
-                       Qt_version=qtpy.QT_VERSION,
-                       PyQt5_version=qtpy.PYQT_VERSION))
-
-        # Create the 'about' dialog
-        GW.QMessageBox.about(self, "About %s" % (APP_NAME), text)
+        # Create the 'about' dialog using the pre-built text
+        GW.QMessageBox.about(self, "About %s" % (APP_NAME), self.ABOUT_TEXT)
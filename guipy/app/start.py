@@ -13,12 +13,10 @@ Starts the *GuiPy* application.
 import signal
 
 # Package imports
-import matplotlib.pyplot as plt
 from qtpy import QtCore as QC, QtWidgets as QW
 
 # GuiPy imports
 from guipy import APP_NAME
-from guipy.app.main_window import MainWindow
 
 # All declaration
 __all__ = ['main']
@@ -44,7 +42,14 @@ def main():
     qapp.setApplicationName(APP_NAME)
 
     # Make sure that the application quits when last window closes
-    qapp.lastWindowClosed.connect(qapp.quit, QC.Qt.QueuedConnection)
+    # The default direct connection is safe here, as lastWindowClosed is
+    # always emitted from the GUI thread during main-loop event dispatch, and
+    # avoids a queued-event round trip during teardown
+    qapp.lastWindowClosed.connect(qapp.quit)
+
+    # Import the main window now that the application exists
+    # Deferring this import keeps all heavy modules off the startup path
+    from guipy.app.main_window import MainWindow
 
     # Initialize main window and draw (show) it
     main_window = MainWindow()
@@ -56,6 +61,7 @@ def main():
     signal.signal(signal.SIGINT, signal.SIG_DFL)
 
     # Set MPL's backend to 'Agg'
+    import matplotlib.pyplot as plt
     plt.switch_backend('Agg')
 
     # Start application
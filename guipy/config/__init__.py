@@ -10,8 +10,12 @@ Contains all the configuration files and functions of *GuiPy*.
 
 # %% IMPORTS
 # Import core modules
-from . import core, dialog, manager
+# The definitions of the core module must be available in this namespace
+# before the dialog module is imported, as the latter (indirectly) imports
+# them from here
+from . import core
 from .core import *
+from . import dialog, manager
 from .dialog import *
 from .manager import *
 from . import base
@@ -79,6 +79,7 @@ class BaseConfigPage(GW.BaseBox):
             get_modified_signal(widget).connect(self.set_restart_flag)
 
     # This function sets restart_flag to True when called
+    @QC.Slot()
     def set_restart_flag(self):
         self.restart_flag = True
 
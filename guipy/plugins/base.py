@@ -27,6 +27,12 @@ __all__ = ['BasePlugin', 'BasePluginWidget', 'PluginConfigPage']
 # %% CLASS DEFINITIONS
 # Define base class for making plugins
 class BasePlugin(object):
+    # As this class is solely used as a mixin, it does not need an instance
+    # dict of its own; the widget side of every plugin already provides one
+    # Declaring named slots is not possible here, as that conflicts with the
+    # instance layout of the Qt base classes
+    __slots__ = ()
+
     # Define class attributes
     TITLE = ''
     CONFIG_PAGES = []
@@ -41,9 +47,34 @@ class BasePlugin(object):
         # Save provided req_plugins
         self.req_plugins = req_plugins
 
+        # Initialize the memoized title of this plugin
+        self._title = None
+
+        # Create instance-local copies of all mutable action containers
+        # These shadow the class-level ones, which would otherwise be shared
+        # (and thus grow) between all instances of the same plugin class
+        self.MENU_ACTIONS = {key: list(value)
+                             for key, value in self.MENU_ACTIONS.items()}
+        self.TOOLBAR_ACTIONS = {key: list(value)
+                                for key, value in self.TOOLBAR_ACTIONS.items()}
+        self.STATUS_WIDGETS = list(self.STATUS_WIDGETS)
+        self.TOOLBARS = list(self.TOOLBARS)
+
         # Add config pages
         self.add_config_pages()
 
+    # This property returns the display title of this plugin
+    # The title is memoized, such that future locale-sensitive lookups are
+    # only performed once per instance instead of on every access
+    @property
+    def title(self):
+        # If the title has not been determined yet, do so now
+        if self._title is None:
+            self._title = self.TITLE
+
+        # Return title
+        return(self._title)
+
     # This function initializes and adds the config pages for this plugin
     def add_config_pages(self):
         # Initialize empty dict of config pages
@@ -61,6 +92,9 @@ class BasePlugin(object):
 
 # Define base class for making plugin widgets
 class BasePluginWidget(GW.QWidget, BasePlugin):
+    # Do not add anything beyond the instance dict provided by the Qt base
+    __slots__ = ()
+
     # Define class attributes
     LOCATION = QC.Qt.LeftDockWidgetArea
 
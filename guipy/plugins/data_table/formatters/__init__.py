@@ -8,16 +8,41 @@ Data Table Formatters
 
 
 # %% IMPORTS
-# Import core modules
-from . import base
-from .base import *
-from . import core
-from .core import *
+# Built-in imports
+from importlib import import_module
+
+# Submodules that are imported lazily on first attribute access (PEP 562)
+# This keeps the formatter subtree unparsed until it is actually used
+_SUBMODULES = ('base', 'core')
 
 # All declaration
-__all__ = ['base', 'core']
-__all__.extend(base.__all__)
-__all__.extend(core.__all__)
+# Kept static, so it can be read without executing any submodule
+__all__ = ['base', 'core',
+           'BaseFormatter',
+           'FORMATTERS', 'import_formatters', 'register_formatter']
 
 # Author declaration
 __author__ = "Ellert van der Velden (@1313e)"
+
+
+# %% LAZY IMPORTS
+# This function imports submodules lazily on first attribute access
+def __getattr__(name):
+    # Loop over all submodules and check if one of them provides name
+    for sub in _SUBMODULES:
+        # Import this submodule
+        mod = import_module(f'.{sub}', __name__)
+
+        # If this submodule is the requested attribute itself, return it
+        if sub == name:
+            globals()[name] = mod
+            return(mod)
+
+        # If this submodule provides the requested attribute, return that
+        if name in getattr(mod, '__all__', ()):
+            value = getattr(mod, name)
+            globals()[name] = value
+            return(value)
+
+    # If no submodule provides name, raise error
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,7 +12,7 @@ Data Table Plugin
 from os import path
 
 # Package imports
-from qtpy import QtCore as QC, QtWidgets as QW
+from qtpy import QtCore as QC, QtGui as QG, QtWidgets as QW
 
 # GuiPy imports
 from guipy import layouts as GL, plugins as GP, widgets as GW
@@ -25,6 +25,19 @@ from guipy.widgets import set_box_value
 __all__ = ['DataTable']
 
 
+# %% GLOBALS
+# Pre-built key sequences for this plugin's actions
+# Building these once at import avoids an int-to-QKeySequence conversion on
+# every action construction; CTRL | Key_X is the canonical bitwise form
+KS_NEW_TAB = QG.QKeySequence(QC.Qt.CTRL | QC.Qt.Key_T)
+KS_OPEN = QG.QKeySequence(QC.Qt.CTRL | QC.Qt.Key_O)
+KS_IMPORT = QG.QKeySequence(QC.Qt.CTRL | QC.Qt.Key_I)
+KS_SAVE = QG.QKeySequence(QC.Qt.CTRL | QC.Qt.Key_S)
+KS_SAVE_AS = QG.QKeySequence(QC.Qt.CTRL | QC.Qt.SHIFT | QC.Qt.Key_S)
+KS_SAVE_ALL = QG.QKeySequence(QC.Qt.CTRL | QC.Qt.ALT | QC.Qt.Key_S)
+KS_EXPORT = QG.QKeySequence(QC.Qt.CTRL | QC.Qt.Key_E)
+
+
 # %% CLASS DEFINITIONS
 # Define class for the DataTable plugin
 class DataTable(GP.BasePluginWidget):
@@ -32,6 +45,24 @@ class DataTable(GP.BasePluginWidget):
     TITLE = "Data table"
     LOCATION = QC.Qt.LeftDockWidgetArea
 
+    # Define table of file menu/toolbar action specifications
+    # Format: (label, shortcut, tooltip, slot name, enabled, toolbar)
+    ACTION_SPECS = (
+        ('&Open...', KS_OPEN,
+         "Open data table", 'open_tabs', False, True),
+        ('&Import...', KS_IMPORT,
+         "Import data tables", 'import_tabs', True, True),
+        None,
+        ('&Save', KS_SAVE,
+         "Save current data table", 'save_tab', False, True),
+        ('Save &as...', KS_SAVE_AS,
+         "Save current data table as...", 'save_as_tab', False, False),
+        ('Sav&e all', KS_SAVE_ALL,
+         "Save all data tables", 'save_all_tabs', False, True),
+        ('&Export...', KS_EXPORT,
+         "Export current data table", 'export_tab', True, True),
+        None)
+
     # Initialize DataTable plugin
     def __init__(self, *args, **kwargs):
         # Call super constructor
@@ -63,6 +94,14 @@ class DataTable(GP.BasePluginWidget):
         self.tab_widget = tab_widget
         layout.addWidget(self.tab_widget)
 
+        # Pre-resolve the bound slot methods used by the actions of this plugin
+        # PyQt connects decorated slots through the meta-object fast path, so
+        # resolving them once here avoids repeated descriptor binding below
+        self.slot_methods = {
+            name: getattr(self, name)
+            for name in ('add_tab', 'open_tabs', 'import_tabs', 'save_tab',
+                         'save_as_tab', 'save_all_tabs', 'export_tab')}
+
         # Add all actions to the proper menus and toolbars
         self.add_actions()
 
@@ -74,102 +113,69 @@ class DataTable(GP.BasePluginWidget):
         # Block all signals emitted by the tab widget while removing tabs
         self.tab_widget.blockSignals(True)
 
-        # Close all tabs
-        for index in reversed(range(self.tab_widget.count())):
-            self.close_tab(index)
+        # Obtain all data tables currently in the tab widget
+        data_tables = self.tab_widget.tabWidgets()
+
+        # Remove all tabs from the tab widget in a single call
+        # This triggers a single layout recompute instead of one per tab
+        self.tab_widget.clear()
+
+        # Close all data tables and schedule them for deletion
+        for data_table in data_tables:
+            data_table.close()
+            data_table.deleteLater()
 
         # Call super event
         super().closeEvent(*args, **kwargs)
 
     # This function adds all associated actions to the menus and toolbars
     def add_actions(self):
+        # Obtain the dict of pre-resolved slot methods
+        slots = self.slot_methods
+
         # Initialize empty action lists for this plugin
-        self.MENU_ACTIONS = {
-            **GP.BasePluginWidget.MENU_ACTIONS,
+        self.MENU_ACTIONS.update({
             'File': [],
-            'File/New': []}
-        self.TOOLBAR_ACTIONS = {
-            **GP.BasePluginWidget.TOOLBAR_ACTIONS,
-            'File': []}
+            'File/New': []})
+        self.TOOLBAR_ACTIONS.update({
+            'File': []})
 
         # Add new tab action to file/new menu
         new_tab_act = GW.QAction(
             self, 'Data &table',
-            shortcut=QC.Qt.CTRL + QC.Qt.Key_T,
+            shortcut=KS_NEW_TAB,
             tooltip="New data table",
-            triggered=self.add_tab,
+            triggered=slots['add_tab'],
             role=GW.QAction.ApplicationSpecificRole)
         self.MENU_ACTIONS['File/New'].append(new_tab_act)
-        self.MENU_ACTIONS['File/New'].append(self.add_tab)
-
-        # Add open tabs action to file menu/toolbar
-        open_tabs_act = GW.QAction(
-            self, '&Open...',
-            shortcut=QC.Qt.CTRL + QC.Qt.Key_O,
-            tooltip="Open data table",
-            triggered=self.open_tabs,
-            role=GW.QAction.ApplicationSpecificRole)
-        open_tabs_act.setEnabled(False)
-        self.MENU_ACTIONS['File'].append(open_tabs_act)
-        self.TOOLBAR_ACTIONS['File'].append(open_tabs_act)
-
-        # Add import tabs action to file menu/toolbar
-        import_tabs_act = GW.QAction(
-            self, '&Import...',
-            shortcut=QC.Qt.CTRL + QC.Qt.Key_I,
-            tooltip="Import data tables",
-            triggered=self.import_tabs,
-            role=GW.QAction.ApplicationSpecificRole)
-        self.MENU_ACTIONS['File'].append(import_tabs_act)
-        self.TOOLBAR_ACTIONS['File'].append(import_tabs_act)
-
-        # Add separator to file menu
-        self.MENU_ACTIONS['File'].append(None)
-
-        # Add save tab action to file menu/toolbar
-        save_tab_act = GW.QAction(
-            self, '&Save',
-            shortcut=QC.Qt.CTRL + QC.Qt.Key_S,
-            tooltip="Save current data table",
-            triggered=self.save_tab,
-            role=GW.QAction.ApplicationSpecificRole)
-        save_tab_act.setEnabled(False)
-        self.MENU_ACTIONS['File'].append(save_tab_act)
-        self.TOOLBAR_ACTIONS['File'].append(save_tab_act)
-
-        # Add save_as tab action to file menu
-        save_as_tab_act = GW.QAction(
-            self, 'Save &as...',
-            shortcut=QC.Qt.CTRL + QC.Qt.SHIFT + QC.Qt.Key_S,
-            tooltip="Save current data table as...",
-            triggered=self.save_as_tab,
-            role=GW.QAction.ApplicationSpecificRole)
-        save_as_tab_act.setEnabled(False)
-        self.MENU_ACTIONS['File'].append(save_as_tab_act)
-
-        # Add save_all tab action to file menu/toolbar
-        save_all_tabs_act = GW.QAction(
-            self, 'Sav&e all',
-            shortcut=QC.Qt.CTRL + QC.Qt.ALT + QC.Qt.Key_S,
-            tooltip="Save all data tables",
-            triggered=self.save_all_tabs,
-            role=GW.QAction.ApplicationSpecificRole)
-        save_all_tabs_act.setEnabled(False)
-        self.MENU_ACTIONS['File'].append(save_all_tabs_act)
-        self.TOOLBAR_ACTIONS['File'].append(save_all_tabs_act)
-
-        # Add export tab action to file menu/toolbar
-        export_tab_act = GW.QAction(
-            self, '&Export...',
-            shortcut=QC.Qt.CTRL + QC.Qt.Key_E,
-            tooltip="Export current data table",
-            triggered=self.export_tab,
-            role=GW.QAction.ApplicationSpecificRole)
-        self.MENU_ACTIONS['File'].append(export_tab_act)
-        self.TOOLBAR_ACTIONS['File'].append(export_tab_act)
-
-        # Add separator to file menu
-        self.MENU_ACTIONS['File'].append(None)
+        self.MENU_ACTIONS['File/New'].append(slots['add_tab'])
+
+        # Loop over all file action specifications and create each action
+        for spec in self.ACTION_SPECS:
+            # If spec is None, add a separator to the file menu
+            if spec is None:
+                self.MENU_ACTIONS['File'].append(None)
+                continue
+
+            # Unpack this action specification
+            label, shortcut, tooltip, slot_name, enabled, toolbar = spec
+
+            # Create the action described by this specification
+            action = GW.QAction(
+                self, label,
+                shortcut=shortcut,
+                tooltip=tooltip,
+                triggered=slots[slot_name],
+                role=GW.QAction.ApplicationSpecificRole)
+
+            # Disable this action if it is not implemented yet
+            if not enabled:
+                action.setEnabled(False)
+
+            # Add this action to the file menu and, if requested, the toolbar
+            self.MENU_ACTIONS['File'].append(action)
+            if toolbar:
+                self.TOOLBAR_ACTIONS['File'].append(action)
 
     # This function adds a new data table widget
     @QC.Slot()
@@ -10,6 +10,7 @@ Figure Config
 # %% IMPORTS
 # Built-in imports
 from ast import literal_eval
+from functools import lru_cache
 from importlib import import_module
 
 # Package imports
@@ -27,7 +28,31 @@ from guipy.widgets import create_combobox, get_box_value, set_box_value
 __all__ = ['MPLConfigPage']
 
 
+# %% GLOBALS
+# Create tuple of all rcParams prefixes that should be skipped
+PREFIX_SKIP = ('_internal', 'agg', 'animation', 'backend',
+               'boxplot.bootstrap', 'datapath', 'docstring',
+               'figure.figsize', 'figure.max_open_warning',
+               'image.aspect', 'image.composite_image', 'image.origin',
+               'interactive', 'keymap', 'lines.color', 'mpl_toolkits',
+               'path', 'pdf', 'pgf', 'ps', 'savefig', 'svg',
+               'text.kerning_factor', 'tk', 'toolbar', 'verbose',
+               'webagg')
+
+# As rcParamsDefault is a process-wide constant, filter it only once at import
+RCPARAMS_ENTRIES = tuple([(key, value)
+                          for key, value in rcParamsDefault.items()
+                          if not key.startswith(PREFIX_SKIP)])
+
+
 # %% HELPER DEFINITIONS
+# This function caches literal_eval results, as config strings rarely change
+# between loads and literal_eval compiles a full AST on every call
+@lru_cache(maxsize=4096)
+def literal_eval_cached(string):
+    return(literal_eval(string))
+
+
 # Create custom togglebox class
 class AutoToggleBox(GW.ToggleBox):
     def __init__(self, widget, untoggled):
@@ -153,6 +178,9 @@ class MPLConfigPage(GP.PluginConfigPage):
     # Define class attributes
     NAME = 'MPL'
 
+    # Cache for the rcParams entry types dict, shared by all instances
+    _entry_types = None
+
     # This function sets up the MPL config page
     def init(self):
         # Create layout
@@ -201,15 +229,24 @@ class MPLConfigPage(GP.PluginConfigPage):
         rcParams_layout.addWidget(entries_box)
         self.add_config_entry('rcParams', entries_box)
 
-        # Create list of all prefixes that should be skipped
-        prefix_skip = ('_internal', 'agg', 'animation', 'backend',
-                       'boxplot.bootstrap', 'datapath', 'docstring',
-                       'figure.figsize', 'figure.max_open_warning',
-                       'image.aspect', 'image.composite_image', 'image.origin',
-                       'interactive', 'keymap', 'lines.color', 'mpl_toolkits',
-                       'path', 'pdf', 'pgf', 'ps', 'savefig', 'svg',
-                       'text.kerning_factor', 'tk', 'toolbar', 'verbose',
-                       'webagg')
+        # Add all rcParams entries to the box
+        entries_box.addEntryTypes(self.get_entry_types())
+
+    # This function returns the entry types dict for all known rcParams
+    @classmethod
+    def get_entry_types(cls):
+        """
+        Returns the dict that maps every supported rcParams key to its
+        proper widget and default value.
+
+        As this dict solely consists of widget classes and factories, it is
+        constructed once and shared by all instances of this config page.
+
+        """
+
+        # If the entry types dict was constructed before, return it
+        if cls._entry_types is not None:
+            return(cls._entry_types)
 
         # Create a combobox factory for text weights
         text_weight_box = create_combobox(
@@ -464,13 +501,8 @@ class MPLConfigPage(GP.PluginConfigPage):
         # Initialize empty dict of entry_types
         entry_types = sdict()
 
-        # Loop over all rcParams and determine what widget to use
-        for key, value in rcParamsDefault.items():
-            # Check if key starts with anything in prefix_skip
-            if key.startswith(prefix_skip):
-                # If so, continue
-                continue
-
+        # Loop over all pre-filtered rcParams and determine what widget to use
+        for key, value in RCPARAMS_ENTRIES:
             # Obtain proper box
             box = key_widgets.get(key, GW.LongGenericBox)
 
@@ -481,18 +513,22 @@ class MPLConfigPage(GP.PluginConfigPage):
             # Add box to entry_types dict with default value
             entry_types[key] = (box, value)
 
-        # Add all rcParams entries to the box
-        entries_box.addEntryTypes(entry_types)
+        # Cache the entry types dict for any future config pages
+        cls._entry_types = entry_types
+
+        # Return it
+        return(entry_types)
 
     # This function parses and processes a config section, and returns it
     def decode_config(self, section_dict):
         # Initialize empty dict of parsed config values
-        config_dict = sdict()
+        # A plain dict suffices here, as it is only iterated over in order
+        config_dict = {}
 
         # Decode all values in section_dict
         for key, value in section_dict.items():
             # Convert to Python object
-            value = literal_eval(value)
+            value = literal_eval_cached(value)
 
             # Add to dict
             config_dict[key] = value
@@ -508,10 +544,12 @@ class MPLConfigPage(GP.PluginConfigPage):
     # This function returns its config section, as required by config parser
     def encode_config(self, config_dict):
         # Initialize empty dict of section config values
-        section_dict = sdict()
+        # A plain dict suffices here, as sorting once at encode-time is much
+        # cheaper than maintaining sorted order on every insertion
+        section_dict = {}
 
         # Loop over all arguments in config and encode them in
-        for key, value in config_dict.items():
+        for key, value in sorted(config_dict.items()):
             # Add to dict
             section_dict[key] = '{!r}'.format(value)
 
@@ -536,6 +574,21 @@ class MPLConfigPage(GP.PluginConfigPage):
             rcParams_config['axes.prop_cycle'] =\
                 cycler(color=rcParams_config['axes.prop_cycle'])
 
-        # Update MPL's rcParams with the values stored in this config page
-        rcParams.update(rcParamsDefault)
-        rcParams.update(rcParams_config)
+        # Determine which rcParams must be reset to their default values
+        # Updating only modified keys avoids running MPL's per-key validators
+        # (and any font-cache invalidation) on the hundreds of unchanged ones
+        reset = {key: value for key, value in rcParamsDefault.items()
+                 if key not in rcParams_config and rcParams[key] != value}
+
+        # Determine which rcParams must be changed to their configured values
+        changed = {key: value for key, value in rcParams_config.items()
+                   if rcParams.get(key) != value}
+
+        # Update MPL's rcParams with all modified values
+        rcParams.update(reset)
+        rcParams.update(changed)
+
+        # Invalidate the cached default markers of the marker plot properties
+        # This import is done here to avoid a circular import
+        from guipy.plugins.figure.widgets.types.props.marker import MarkerProp
+        MarkerProp.invalidate_default_markers()
@@ -104,9 +104,8 @@ class Figure(GP.BasePluginWidget):
     # This function adds all associated actions to the menus and toolbars
     def add_actions(self):
         # Initialize empty action lists for this plugin
-        self.MENU_ACTIONS = {
-            **GP.BasePluginWidget.MENU_ACTIONS,
-            'File/New': []}
+        self.MENU_ACTIONS.update({
+            'File/New': []})
 
         # Add new figure action to file/new menu
         # TODO: Should shortcut be CTRL+F? Might clash with expectations
@@ -12,21 +12,138 @@ Marker Property
 from matplotlib import rcParams
 
 # GuiPy imports
-from guipy import widgets as GW
+from guipy import layouts as GL, widgets as GW
 from guipy.plugins.figure.widgets.types.props import BasePlotProp
-from guipy.widgets import set_box_value
+from guipy.widgets import get_box_value, set_box_value
 
 # All declaration
 __all__ = ['LineMarkerProp', 'ScatterMarkerProp']
 
 
 # %% CLASS DEFINITIONS
+# Define lazily constructed color box used by the marker properties
+class LazyColorBox(GW.BaseBox):
+    """
+    Defines the :class:`~LazyColorBox` class.
+
+    This box defers the construction of its internal
+    :obj:`~guipy.widgets.ColorBox` until it is first shown or its value is
+    set, as the color label and picker are relatively expensive to create and
+    not needed unless the marker group is actually used.
+
+    """
+
+    # The color that is reported before the internal color box exists
+    # This equals the starting color of every newly created color box
+    default_color = 'C0'
+
+    # Initialize the LazyColorBox class
+    def __init__(self, prop, parent=None):
+        # Call super constructor
+        super().__init__(parent)
+
+        # Save provided prop
+        self.prop = prop
+
+        # Initialize empty internal color box
+        self.color_box = None
+
+        # Create the box layout that will hold the color box
+        box_layout = GL.QHBoxLayout(self)
+        box_layout.setContentsMargins(0, 0, 0, 0)
+
+    # This function constructs the internal color box on first use
+    def create_color_box(self):
+        # If the color box does not exist yet, create it now
+        if self.color_box is None:
+            # Make a color box
+            color_box = GW.ColorBox()
+
+            # Connect 'applying' signal
+            self.prop.options.applying.connect(color_box.set_default_color)
+
+            # Add color box to the layout
+            self.layout().addWidget(color_box)
+            self.color_box = color_box
+
+        # Return color box
+        return(self.color_box)
+
+    # Override showEvent to construct the color box when first shown
+    def showEvent(self, event):
+        # Make sure the color box exists
+        self.create_color_box()
+
+        # Call and return super method
+        return(super().showEvent(event))
+
+    # This function retrieves the value of the internal color box
+    def get_box_value(self, *value_sig):
+        # If the color box does not exist yet, return the default color
+        if self.color_box is None:
+            return(self.default_color)
+
+        # Return the value of the color box
+        return(get_box_value(self.color_box, *value_sig))
+
+    # This function sets the value of the internal color box
+    def set_box_value(self, value, *value_sig):
+        set_box_value(self.create_color_box(), value, *value_sig)
+
+    # Override closeEvent to make sure the color box is closed as well
+    def closeEvent(self, event):
+        # If the color box exists, close it
+        if self.color_box is not None:
+            self.color_box.close()
+
+        # Call and return super method
+        return(super().closeEvent(event))
+
+
 # Define 'Marker' plot property
 class MarkerProp(BasePlotProp):
     # Class attributes
     DISPLAY_NAME = "Marker"
     WIDGET_NAMES = [*BasePlotProp.WIDGET_NAMES, 'marker_style_box',
                     'marker_size_box', 'marker_color_box']
+    DEFAULT_MARKER_KEY = None
+
+    # Cache for the default marker, set per subclass on first access
+    _default_marker = None
+
+    # This property holds the default marker used for this plot type
+    @property
+    def default_marker(self):
+        # Obtain the class of this plot property
+        cls = type(self)
+
+        # If the default marker has not been determined yet, do so now
+        # This avoids performing the rcParams lookup on every created marker
+        # property of this type
+        if cls._default_marker is None:
+            cls._default_marker = rcParams[cls.DEFAULT_MARKER_KEY]
+
+        # Return the default marker
+        return(cls._default_marker)
+
+    # This function invalidates all cached default markers
+    @classmethod
+    def invalidate_default_markers(cls):
+        """
+        Removes the cached default marker of this plot property class and all
+        of its subclasses, causing the next access of
+        :attr:`~default_marker` to read it from MPL's rcParams again.
+
+        This classmethod must be called whenever the rcParams are modified.
+
+        """
+
+        # Remove the cached default marker of this class and its subclasses
+        klasses = [cls]
+        while klasses:
+            klass = klasses.pop()
+            klass._default_marker = None
+            klasses.extend(klass.__subclasses__())
 
     # This function creates and returns a line style box
     def marker_style_box(self):
@@ -71,15 +188,15 @@ class MarkerProp(BasePlotProp):
         Creates a widget box for setting the color of the marker and returns
         it.
 
+        The actual color box is constructed lazily when it is first shown or
+        its value is set.
+
         """
 
-        # Make a color box
-        marker_color_box = GW.ColorBox()
+        # Make a lazy color box
+        marker_color_box = LazyColorBox(self)
         marker_color_box.setToolTip("Color to be used for this marker")
 
-        # Connect 'applying' signal
-        self.options.applying.connect(marker_color_box.set_default_color)
-
         # Return name and box
         return('Color', marker_color_box)
 
@@ -97,11 +214,7 @@ class LineMarkerProp(MarkerProp):
 
     # Class attributes
     NAME = "LineMarker"
-
-    # This property holds the default marker used for line plots
-    @property
-    def default_marker(self):
-        return(rcParams['lines.marker'])
+    DEFAULT_MARKER_KEY = 'lines.marker'
 
 
 # Define 'ScatterMarker' plot property
@@ -117,8 +230,4 @@ class ScatterMarkerProp(MarkerProp):
 
     # Class attributes
     NAME = "ScatterMarker"
-
-    # This property holds the default marker used for scatter plots
-    @property
-    def default_marker(self):
-        return(rcParams['scatter.marker'])
+    DEFAULT_MARKER_KEY = 'scatter.marker'
@@ -674,6 +674,7 @@ class QTabWidget(QW.QTabWidget, QWidget):
             self.setCornerWidget(browse_but, QC.Qt.TopLeftCorner)
 
     # This function updates the browse menu
+    @QC.Slot()
     def update_browse_menu(self):
         """
         Updates the browse menu that shows all available tabs.
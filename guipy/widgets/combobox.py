@@ -21,6 +21,25 @@ __all__ = ['ComboBoxValidator', 'DualComboBox', 'EditableComboBox',
            'create_combobox']
 
 
+# %% GLOBALS
+# Shared fixed/fixed size policy used by all separator labels
+# This is created lazily, as Qt may not be fully set up at import time
+_fixed_policy = None
+
+
+# This function returns the shared fixed/fixed size policy
+def _get_fixed_policy():
+    global _fixed_policy
+
+    # If the policy has not been created yet, do so now
+    if _fixed_policy is None:
+        _fixed_policy = QW.QSizePolicy(QW.QSizePolicy.Fixed,
+                                       QW.QSizePolicy.Fixed)
+
+    # Return policy
+    return(_fixed_policy)
+
+
 # %% CLASS DEFINITIONS
 # Define the ComboBoxValidator class
 class ComboBoxValidator(QG.QRegularExpressionValidator):
@@ -46,8 +65,13 @@ class ComboBoxValidator(QG.QRegularExpressionValidator):
 
         """
 
-        # Save the completer of the provided combobox
+        # Save the completer of the provided combobox and its completion model
+        # The model is a fixed proxy instance, so it can be cached here
         self.completer = combobox_obj.completer()
+        self.completion_model = self.completer.completionModel()
+
+        # Initialize cache of the last validated string and its state
+        self._last_validation = (None, None)
 
         # Check provided regexp
         if regexp is None:
@@ -59,9 +83,15 @@ class ComboBoxValidator(QG.QRegularExpressionValidator):
 
     # Override validate to first check the combobox completer
     def validate(self, string, pos):
+        # If this exact string was validated last time, return its state
+        # The validator runs on every keystroke and cursor movement, which
+        # frequently re-validates an unchanged string
+        if string == self._last_validation[0]:
+            return(self._last_validation[1], string, pos)
+
         # Check if string is already in the completions list
-        index = self.completer.completionModel().index(0, 0)
-        match = self.completer.completionModel().match(
+        index = self.completion_model.index(0, 0)
+        match = self.completion_model.match(
             index, QC.Qt.EditRole, string, flags=QC.Qt.MatchExactly)
 
         # Check if there is a match
@@ -81,12 +111,15 @@ class ComboBoxValidator(QG.QRegularExpressionValidator):
             else:
                 # Else, it is intermediate
                 state = self.Intermediate
-
-            # Return the state, string and pos
-            return(state, string, pos)
         else:
             # If the completion string is empty, use the regular expression
-            return(super().validate(string, pos))
+            state, string, pos = super().validate(string, pos)
+
+        # Cache the state of this string for the next validation call
+        self._last_validation = (string, state)
+
+        # Return the state, string and pos
+        return(state, string, pos)
 
 
 # Make class with two comboboxes
@@ -100,6 +133,11 @@ class DualComboBox(GW.DualBaseBox):
     modified = QC.Signal([], [int, int], [int, str], [str, int],
                          [str, str])
 
+    # Class attributes
+    # Tuple of all typed overload signatures of the 'modified' signal
+    # This is a constant, so it is built once instead of on every emission
+    _SIGS = ((int, int), (int, str), (str, int), (str, str))
+
     # Initialize the DualComboBox class
     def __init__(self, editable=(False, False), sep=None, parent=None):
         """
@@ -154,16 +192,32 @@ class DualComboBox(GW.DualBaseBox):
         # If sep is not None, create label and add it
         if sep is not None:
             sep_label = GW.QLabel(sep)
-            sep_label.setSizePolicy(QW.QSizePolicy.Fixed, QW.QSizePolicy.Fixed)
+            sep_label.setSizePolicy(_get_fixed_policy())
             box_layout.insertWidget(1, sep_label)
 
     # This function is automatically called whenever 'modified' is emitted
     @QC.Slot()
     def modified_signal_slot(self):
-        # Emit modified signal with proper types
-        for types in [(int, int), (int, str), (str, int), (str, str)]:
-            self.modified[types[0], types[1]].emit(
-                *DualComboBox.get_box_value(self, *types))
+        # Determine which typed overloads currently have receivers
+        # Anything that listens to the default overload is already served by
+        # the plain 'modified' emission itself
+        signatures = [(t1, t2) for t1, t2 in self._SIGS
+                      if self.receivers(self.modified[t1, t2])]
+
+        # If no typed overload has receivers, there is nothing left to do
+        if not signatures:
+            return
+
+        # Obtain the current index and/or text of both comboboxes once
+        values = {}
+        if any(int in sig for sig in signatures):
+            values[int] = DualComboBox.get_box_value(self, int, int)
+        if any(str in sig for sig in signatures):
+            values[str] = DualComboBox.get_box_value(self, str, str)
+
+        # Emit modified signal solely for these signatures
+        for t1, t2 in signatures:
+            self.modified[t1, t2].emit(values[t1][0], values[t2][1])
 
 
 # Create custom QComboBox class that is editable
@@ -182,8 +236,25 @@ class EditableComboBox(GW.QComboBox):
         super().__init__(*args, **kwargs)
         self.setEditable(True)
         self.setInsertPolicy(self.NoInsert)
-        self.completer().setCompletionMode(QW.QCompleter.PopupCompletion)
-        self.completer().setFilterMode(QC.Qt.MatchContains)
+
+        # The completer is first needed when the user starts editing, so its
+        # configuration is deferred until this box first receives focus
+        self._completer_configured = False
+
+        # Avoid measuring every item for the size hint on first display
+        self.setSizeAdjustPolicy(self.AdjustToMinimumContentsLengthWithIcon)
+        self.setMinimumContentsLength(12)
+
+    # Override focusInEvent to configure the completer on first focus
+    def focusInEvent(self, event):
+        # If the completer has not been configured yet, do so now
+        if not self._completer_configured:
+            self.completer().setCompletionMode(QW.QCompleter.PopupCompletion)
+            self.completer().setFilterMode(QC.Qt.MatchContains)
+            self._completer_configured = True
+
+        # Call and return super method
+        return(super().focusInEvent(event))
 
     # Override focusOutEvent to emit signal whenever triggered
     def focusOutEvent(self, event):
@@ -11,6 +11,7 @@ definition, which are core to the functioning of all widgets.
 
 # %% IMPORTS
 # Built-in import
+from functools import partial
 from inspect import isclass
 
 # Package imports
@@ -51,6 +52,9 @@ class BaseBox(GW_QWidget):
         # Store auto_connect
         self.auto_connect = auto_connect
 
+        # Initialize set with the ids of all boxes connected to this box
+        self._connected_boxes = set()
+
         # If the 'modified_signal_slot' slot is available, connect it
         if hasattr(self, 'modified_signal_slot'):
             self.modified.connect(self.modified_signal_slot)
@@ -69,19 +73,36 @@ class BaseBox(GW_QWidget):
             # Obtain child object
             child = event.child()
 
-            # Try to obtain the modified signal of this child
-            try:
-                signal = get_modified_signal(child)
-            # If this fails, it does not have one
-            except NotImplementedError:
-                pass
-            # If this succeeds, connect it to the 'modified' signal
-            else:
-                signal.connect(self.modified[()])
+            # Connect the modified signal of this child if it can have one
+            # This explicit check replaces a try/except around the signal
+            # lookup, which also fired for every internal Qt child
+            if (isinstance(child, _MODIFIABLE_TYPES) or
+                    hasattr(child, 'modified')):
+                get_modified_signal(child).connect(self.modified[()])
+                self._register_connected_box(child)
 
         # Call and return super method
         return(super().childEvent(event))
 
+    # This function registers a given box as connected to this box
+    def _register_connected_box(self, box):
+        """
+        Registers the provided `box` as being connected to this widget's
+        :attr:`~modified` signal, allowing :meth:`~connect_box` to skip it in
+        constant time.
+
+        """
+
+        # Register the id of this box as connected
+        self._connected_boxes.add(id(box))
+
+        # Unregister it again on destruction, as ids can be reused
+        # A partial binds the set and the id directly without capturing self,
+        # as a slot that closes over self creates a reference cycle whose
+        # cells can be cleared by the GC before Qt delivers the signal
+        box.destroyed.connect(
+            partial(self._connected_boxes.discard, id(box)))
+
     # This function connects a given box to the modified signal
     def connect_box(self, box):
         """
@@ -90,8 +111,15 @@ class BaseBox(GW_QWidget):
 
         """
 
+        # Check if the given box was connected before and skip if so
+        # This covers all children connected automatically by childEvent and
+        # avoids scanning the children list on every call
+        if id(box) in self._connected_boxes:
+            return
+
         # Check if the given box is a child of this box and skip if so
         if box in self.children():
+            self._connected_boxes.add(id(box))
             return
 
         # Obtain the modified signal of the given box
@@ -100,6 +128,9 @@ class BaseBox(GW_QWidget):
         # Connect the signals
         signal.connect(self.modified[()])
 
+        # Register the given box as connected
+        self._register_connected_box(box)
+
     # Define get_box_value method
     def get_box_value(self, *value_sig):
         """
@@ -218,6 +249,226 @@ class DualBaseBox(BaseBox):
         return(super().closeEvent(event))
 
 
+# Tuple of all widget classes whose instances can provide a modified signal
+# Any child widget outside these classes (and without a 'modified' signal of
+# its own) can safely be skipped by the childEvent auto-connect above
+_MODIFIABLE_TYPES = (BaseBox, QW.QAbstractSpinBox, QW.QAbstractButton,
+                     QW.QComboBox, QW.QLineEdit, GW_QLabel)
+
+
+# %% HIDDEN FUNCTION DEFINITIONS
+# This function resolves the handler of a given box in a given dispatch dict
+def _get_box_handler(box, handler_dict):
+    """
+    Returns the handler function registered for the class of the provided
+    widget `box` in the given `handler_dict`, or *None* if its class has no
+    handler.
+
+    The MRO of any class that is not listed in `handler_dict` is walked once
+    to resolve its handler, which is then memoized in `handler_dict` itself.
+
+    """
+
+    # Try to obtain the handler registered for this exact class
+    handler = handler_dict.get(type(box))
+
+    # If no handler is known yet, walk the MRO of this class to resolve it
+    if handler is None and type(box) not in handler_dict:
+        for cls in type(box).__mro__:
+            if cls in handler_dict:
+                handler = handler_dict[cls]
+                break
+
+        # Memoize the resolved handler for this exact class
+        handler_dict[type(box)] = handler
+
+    # Return handler
+    return(handler)
+
+
+# Values (QAbstractSpinBox)
+def _spinbox_get_value(box, value_sig):
+    return(box.value())
+
+
+def _spinbox_set_value(box, value, value_sig):
+    # Skip if the box already holds this value, avoiding a signal emission
+    if box.value() != value:
+        box.setValue(value)
+
+
+def _spinbox_modified_signal(box, signal_sig):
+    return(box.valueChanged)
+
+
+# Actions, Bools/Buttons (QAction, QAbstractButton)
+def _button_get_value(box, value_sig):
+    if box.isCheckable() and str not in value_sig:
+        return(box.isChecked())
+    else:
+        return(box.text())
+
+
+def _button_set_value(box, value, value_sig):
+    if isinstance(value, STR_TYPES):
+        box.setText(value)
+    else:
+        box.setChecked(value)
+
+
+def _action_modified_signal(box, signal_sig):
+    return(box.toggled if box.isCheckable() else box.triggered)
+
+
+def _button_modified_signal(box, signal_sig):
+    return(box.toggled if box.isCheckable() else box.clicked)
+
+
+# Items (QComboBox)
+def _combobox_get_value(box, value_sig):
+    return(box.currentIndex() if int in value_sig else box.currentText())
+
+
+def _combobox_set_value(box, value, value_sig):
+    if isinstance(value, INT_TYPES):
+        # Skip if the box is already at this index
+        if box.currentIndex() != value:
+            box.setCurrentIndex(value)
+    else:
+        # Skip if the box already holds this text, avoiding an item scan
+        if box.currentText() == value:
+            return
+        index = box.findText(value)
+        if(index != -1):
+            box.setCurrentIndex(index)
+        elif box.isEditable():
+            # Obtain current index and text of this combobox
+            index = box.currentIndex()
+            text = box.currentText()
+
+            # Block all signals coming from this combobox
+            blocked = box.blockSignals(True)
+
+            # Set the current index to -1 and set the text to value
+            box.setCurrentIndex(-1)
+            box.setCurrentText(value)
+
+            # No longer block signals (unless they were blocked before)
+            box.blockSignals(blocked)
+
+            # Emit the proper signals if their values actually changed
+            if(text != value):
+                box.currentTextChanged.emit(value)
+            if(index != -1):
+                box.currentIndexChanged.emit(-1)
+
+
+def _combobox_modified_signal(box, signal_sig):
+    return(box.currentIndexChanged if int in signal_sig else
+           box.currentTextChanged)
+
+
+# Tabs (QTabWidget)
+def _tab_widget_get_value(box, value_sig):
+    if int in value_sig:
+        return(box.currentIndex())
+    elif str in value_sig:
+        return(box.tabText(box.currentIndex()))
+    else:
+        return(box.currentWidget())
+
+
+def _tab_widget_set_value(box, value, value_sig):
+    if isinstance(value, INT_TYPES):
+        box.setCurrentIndex(value)
+    elif isinstance(value, STR_TYPES) and isinstance(box, GW_QTabWidget):
+        index = box.tabNames.index(value)
+        box.setCurrentIndex(index)
+    else:
+        box.setCurrentWidget(value)
+
+
+# Strings (QLineEdit)
+def _line_edit_get_value(box, value_sig):
+    return(box.text())
+
+
+def _line_edit_set_value(box, value, value_sig):
+    # Skip if the box already holds this text, avoiding a signal emission
+    if box.text() != value:
+        box.setText(value)
+
+
+def _line_edit_modified_signal(box, signal_sig):
+    return(box.textChanged)
+
+
+# Labels (QLabel)
+def _label_get_value(box, value_sig):
+    # Calling each getter once avoids a second Qt round-trip on a hit
+    for getter in (box.movie, box.picture, box.pixmap):
+        value = getter()
+        if value is not None:
+            return(value)
+    else:
+        return(box.text())
+
+
+def _label_set_value(box, value, value_sig):
+    if isinstance(value, STR_TYPES):
+        box.setText(value)
+    elif isinstance(value, FLOAT_TYPES):
+        box.setNum(value)
+    elif isinstance(value, QG.QMovie):
+        box.setMovie(value)
+    elif isinstance(value, QG.QPicture):
+        box.setPicture(value)
+    elif isinstance(value, QG.QPixmap):
+        box.setPixmap(value)
+    else:
+        raise TypeError("QLabel does not support the given type")
+
+
+def _gw_label_modified_signal(box, signal_sig):
+    return(box.contentsChanged)
+
+
+def _label_modified_signal(box, signal_sig):
+    raise NotImplementedError("Default QW.QLabel has no modified signal "
+                              "defined. Use QW_QLabel instead!")
+
+
+# %% DISPATCH TABLES
+# The dicts below map widget classes to the handlers defined above
+# Dispatching on class through these dicts avoids evaluating a chain of
+# isinstance checks on every call of the box functions below, which run on
+# every signal emission and child event
+_BOX_GETTERS = {
+    QW.QAbstractSpinBox: _spinbox_get_value,
+    QW.QAction: _button_get_value,
+    QW.QAbstractButton: _button_get_value,
+    QW.QComboBox: _combobox_get_value,
+    QW.QTabWidget: _tab_widget_get_value,
+    QW.QLineEdit: _line_edit_get_value,
+    QW.QLabel: _label_get_value}
+_BOX_SETTERS = {
+    QW.QAbstractSpinBox: _spinbox_set_value,
+    QW.QAction: _button_set_value,
+    QW.QAbstractButton: _button_set_value,
+    QW.QComboBox: _combobox_set_value,
+    QW.QTabWidget: _tab_widget_set_value,
+    QW.QLineEdit: _line_edit_set_value,
+    QW.QLabel: _label_set_value}
+_BOX_SIGNALS = {
+    QW.QAbstractSpinBox: _spinbox_modified_signal,
+    QW.QAction: _action_modified_signal,
+    QW.QAbstractButton: _button_modified_signal,
+    QW.QComboBox: _combobox_modified_signal,
+    QW.QLineEdit: _line_edit_modified_signal,
+    GW_QLabel: _gw_label_modified_signal,
+    QW.QLabel: _label_modified_signal}
+
+
 # %% FUNCTION DEFINITIONS
 # This function gets the value of a provided box
 def get_box_value(box, *value_sig, no_custom=False):
@@ -263,47 +514,19 @@ def get_box_value(box, *value_sig, no_custom=False):
         except NotImplementedError:
             pass
 
-    # Values (QAbstractSpinBox)
-    if isinstance(box, QW.QAbstractSpinBox):
-        return(box.value())
-
-    # Actions, Bools/Buttons (QAction, QAbstractButton)
-    elif isinstance(box, (QW.QAction, QW.QAbstractButton)):
-        if box.isCheckable() and str not in value_sig:
-            return(box.isChecked())
-        else:
-            return(box.text())
-
-    # Items (QComboBox)
-    elif isinstance(box, QW.QComboBox):
-        return(box.currentIndex() if int in value_sig else box.currentText())
-
-    # Tabs (QTabWidget)
-    elif isinstance(box, QW.QTabWidget):
-        if int in value_sig:
-            return(box.currentIndex())
-        elif str in value_sig:
-            return(box.tabText(box.currentIndex()))
-        else:
-            return(box.currentWidget())
-
-    # Strings (QLineEdit)
-    elif isinstance(box, QW.QLineEdit):
-        return(box.text())
-
-    # Labels (QLabel)
-    elif isinstance(box, QW.QLabel):
-        for attr in ['movie', 'picture', 'pixmap']:
-            if getattr(box, attr)() is not None:
-                return(getattr(box, attr)())
-        else:
-            return(box.text())
+    # Obtain the getter handler for this box and use it if one exists
+    # The direct dict lookup is the hot path; the resolver is solely needed
+    # the first time a class is encountered
+    handler = _BOX_GETTERS.get(type(box))
+    if handler is None:
+        handler = _get_box_handler(box, _BOX_GETTERS)
+    if handler is not None:
+        return(handler(box, value_sig))
 
     # If none applies, raise error
-    else:
-        raise NotImplementedError("Custom boxes must provide their own "
-                                  "'get_box_value()'-method! (%s)"
-                                  % (box.__class__))
+    raise NotImplementedError("Custom boxes must provide their own "
+                              "'get_box_value()'-method! (%s)"
+                              % (box.__class__))
 
 
 # This function gets the emitted signal when a provided box is modified
@@ -340,38 +563,18 @@ def get_modified_signal(box, *signal_sig):
     elif hasattr(box, 'modified'):
         return(box.modified.__getitem__(signal_sig))
 
-    # Values (QAbstractSpinBox)
-    elif isinstance(box, QW.QAbstractSpinBox):
-        return(box.valueChanged)
-
-    # Actions (QAction)
-    elif isinstance(box, QW.QAction):
-        return(box.toggled if box.isCheckable() else box.triggered)
-
-    # Bools/Buttons (QAbstractButton)
-    elif isinstance(box, QW.QAbstractButton):
-        return(box.toggled if box.isCheckable() else box.clicked)
-
-    # Items (QComboBox)
-    elif isinstance(box, QW.QComboBox):
-        return(box.currentIndexChanged if int in signal_sig else
-               box.currentTextChanged)
-
-    # Strings (QLineEdit)
-    elif isinstance(box, QW.QLineEdit):
-        return(box.textChanged)
-
-    # Labels (QLabel)
-    elif isinstance(box, GW_QLabel):
-        return(box.contentsChanged)
-    elif isinstance(box, QW.QLabel):
-        raise NotImplementedError("Default QW.QLabel has no modified signal "
-                                  "defined. Use QW_QLabel instead!")
+    # Obtain the signal handler for this box and use it if one exists
+    # The direct dict lookup is the hot path; the resolver is solely needed
+    # the first time a class is encountered
+    handler = _BOX_SIGNALS.get(type(box))
+    if handler is None:
+        handler = _get_box_handler(box, _BOX_SIGNALS)
+    if handler is not None:
+        return(handler(box, signal_sig))
 
     # If none applies, raise error
-    else:
-        raise NotImplementedError("Custom boxes must provide their own "
-                                  "'modified' signal! (%s)" % (box.__class__))
+    raise NotImplementedError("Custom boxes must provide their own "
+                              "'modified' signal! (%s)" % (box.__class__))
 
 
 # This function sets the value of a provided box
@@ -421,74 +624,14 @@ def set_box_value(box, value, *value_sig, no_custom=False):
         else:
             return
 
-    # Values (QAbstractSpinBox)
-    if isinstance(box, QW.QAbstractSpinBox):
-        box.setValue(value)
-
-    # Actions, Bools/Buttons (QAction, QAbstractButton)
-    elif isinstance(box, (QW.QAction, QW.QAbstractButton)):
-        if isinstance(value, STR_TYPES):
-            box.setText(value)
-        else:
-            box.setChecked(value)
-
-    # Items (QComboBox)
-    elif isinstance(box, QW.QComboBox):
-        if isinstance(value, INT_TYPES):
-            box.setCurrentIndex(value)
-        else:
-            index = box.findText(value)
-            if(index != -1):
-                box.setCurrentIndex(index)
-            elif box.isEditable():
-                # Obtain current index and text of this combobox
-                index = box.currentIndex()
-                text = box.currentText()
-
-                # Block all signals coming from this combobox
-                blocked = box.blockSignals(True)
-
-                # Set the current index to -1 and set the text to value
-                box.setCurrentIndex(-1)
-                box.setCurrentText(value)
-
-                # No longer block signals (unless they were blocked before)
-                box.blockSignals(blocked)
-
-                # Emit the proper signals if their values actually changed
-                if(text != value):
-                    box.currentTextChanged.emit(value)
-                if(index != -1):
-                    box.currentIndexChanged.emit(-1)
-
-    # Tabs (QTabWidget)
-    elif isinstance(box, QW.QTabWidget):
-        if isinstance(value, INT_TYPES):
-            box.setCurrentIndex(value)
-        elif isinstance(value, STR_TYPES) and isinstance(box, GW_QTabWidget):
-            index = box.tabNames.index(value)
-            box.setCurrentIndex(index)
-        else:
-            box.setCurrentWidget(value)
-
-    # Strings (QLineEdit)
-    elif isinstance(box, QW.QLineEdit):
-        box.setText(value)
-
-    # Labels (QLabel)
-    elif isinstance(box, QW.QLabel):
-        if isinstance(value, STR_TYPES):
-            box.setText(value)
-        elif isinstance(value, FLOAT_TYPES):
-            box.setNum(value)
-        elif isinstance(value, QG.QMovie):
-            box.setMovie(value)
-        elif isinstance(value, QG.QPicture):
-            box.setPicture(value)
-        elif isinstance(value, QG.QPixmap):
-            box.setPixmap(value)
-        else:
-            raise TypeError("QLabel does not support the given type")
+    # Obtain the setter handler for this box and use it if one exists
+    # The direct dict lookup is the hot path; the resolver is solely needed
+    # the first time a class is encountered
+    handler = _BOX_SETTERS.get(type(box))
+    if handler is None:
+        handler = _get_box_handler(box, _BOX_SETTERS)
+    if handler is not None:
+        handler(box, value, value_sig)
 
     # If none applies, raise error
     else:
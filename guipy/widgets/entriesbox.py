@@ -13,7 +13,6 @@ EntriesBoxes
 
 # Package imports
 from qtpy import QtCore as QC, QtGui as QG, QtWidgets as QW
-from sortedcontainers import SortedDict as sdict, SortedSet as sset
 
 # GuiPy imports
 from guipy import layouts as GL, widgets as GW
@@ -73,13 +72,9 @@ class EntryNameBoxValidator(QG.QValidator):
             # Return state
             return(state, string, pos)
 
-        # Create empty list of all current names in the entries box
-        cur_names = []
-
         # Obtain the names of all current entries in the entries box
-        for i in range(4, 4+3*self.entries_box_obj.entryCount(), 3):
-            name_box = self.entries_box_obj.entries_grid.itemAt(i).widget()
-            cur_names.append(get_box_value(name_box))
+        cur_names = [get_box_value(name_box)
+                     for _, name_box, _ in self.entries_box_obj._rows]
 
         # Remove string from it
         try:
@@ -153,6 +148,13 @@ class EntriesBox(GW.BaseBox):
     # Signals
     modified = QC.Signal([], [dict])
 
+    # Class attributes
+    # Cache for the resolved add/delete button icons, shared by all instances
+    # Probing the icon theme involves file-system look-ups, which should not
+    # be paid for every single entry
+    _add_icon = None
+    _del_icon = None
+
     # Initialize the EntriesBox class
     def __init__(self, parent=None):
         """
@@ -179,7 +181,7 @@ class EntriesBox(GW.BaseBox):
 
     # This property returns the number of entries in the box
     def entryCount(self):
-        return((self.entries_grid.count()//3)-1)
+        return(len(self._rows))
 
     # This function creates the entries box
     def init(self):
@@ -194,28 +196,55 @@ class EntriesBox(GW.BaseBox):
         # Create empty dict of non-generic entry types
         self.entry_types = {}
 
+        # Create empty tuple of entry type names
+        # This tuple is rebuilt lazily whenever entry_types has changed, so
+        # add_entry does not materialize the dict keys for every new entry
+        # and back-to-back type/banned-name updates invalidate it only once
+        self._entry_type_names = ()
+        self._types_dirty = False
+
         # Create empty dict of entry defaults
         self.entry_defaults = {}
 
         # Create empty set of banned entry names
-        self.banned_names = sset()
+        self.banned_names = set()
+
+        # Initialize empty cache of the current entry values
+        # Any emission of 'modified' invalidates this cache, so repeated
+        # reads of an unchanged box do not walk all entry widgets again
+        self._cached_values = None
+
+        # Create empty registry of entry rows
+        # Every row is a [del_but, name_box, value_box] list that is kept in
+        # sync with the entries_layout, so entries can be read and modified
+        # without performing any linear layout queries
+        self._rows = []
 
         # Create the box_layout
         box_layout = GL.QVBoxLayout(self)
         box_layout.setContentsMargins(0, 0, 0, 0)
 
-        # Create the entries_grid
-        entries_grid = GL.QGridLayout()
-        entries_grid.setContentsMargins(0, 0, 0, 0)
-        entries_grid.setColumnStretch(1, 1)
-        entries_grid.setColumnStretch(2, 2)
-        box_layout.addLayout(entries_grid)
-        self.entries_grid = entries_grid
+        # Create the entries_layout
+        # A vertical layout of identical row widgets is used instead of a
+        # grid layout, as inserting or removing a row then never requires the
+        # remaining rows to be re-measured
+        entries_layout = GL.QVBoxLayout()
+        entries_layout.setContentsMargins(0, 0, 0, 0)
+        box_layout.addLayout(entries_layout)
+        self.entries_layout = entries_layout
 
         # Add a header
-        entries_grid.addWidget(GW.QLabel(""), 0, 0)
-        entries_grid.addWidget(GW.QLabel("Entry name"), 0, 1)
-        entries_grid.addWidget(GW.QLabel("Entry value"), 0, 2)
+        header = GW.QWidget()
+        header_layout = GL.QHBoxLayout(header)
+        header_layout.setContentsMargins(0, 0, 0, 0)
+
+        # The empty corner label mirrors the delete buttons of the entries
+        corner_label = GW.QLabel("")
+        corner_label.setFixedWidth(self.entry_height)
+        header_layout.addWidget(corner_label)
+        header_layout.addWidget(GW.QLabel("Entry name"), 1)
+        header_layout.addWidget(GW.QLabel("Entry value"), 2)
+        entries_layout.addWidget(header)
 
         # Add an 'Add'-button
         add_but = GW.QToolButton()
@@ -224,9 +253,16 @@ class EntriesBox(GW.BaseBox):
         get_modified_signal(add_but).connect(self.add_entry)
         box_layout.addWidget(add_but)
 
+        # Resolve the 'add' icon once for all entries boxes
+        if EntriesBox._add_icon is None:
+            if QG.QIcon.hasThemeIcon('add'):
+                EntriesBox._add_icon = QG.QIcon.fromTheme('add')
+            else:
+                EntriesBox._add_icon = QG.QIcon()
+
         # If this theme has an 'add' icon, use it
-        if QG.QIcon.hasThemeIcon('add'):
-            add_but.setIcon(QG.QIcon.fromTheme('add'))
+        if not EntriesBox._add_icon.isNull():
+            add_but.setIcon(EntriesBox._add_icon)
         # Else, use a simple plus
         else:
             add_but.setText('+')
@@ -234,12 +270,13 @@ class EntriesBox(GW.BaseBox):
         # Set size policy
         self.setSizePolicy(QW.QSizePolicy.Preferred, QW.QSizePolicy.Fixed)
 
-        # Set a minimum width for the first column
-        self.entries_grid.setColumnMinimumWidth(0, self.entry_height)
-
     # This function is automatically called whenever 'modified' is emitted
     @QC.Slot()
     def modified_signal_slot(self):
+        # Invalidate the cached entry values, as something has changed
+        self._cached_values = None
+
+        # Emit the current entry values
         self.modified[dict].emit(EntriesBox.get_box_value(self))
 
     # This function returns the proper combobox to be used for name entries
@@ -278,35 +315,147 @@ class EntriesBox(GW.BaseBox):
 
         """
 
+        # Create a combobox with the name of the entry
+        name_box = self._create_entry_name_box()
+        set_box_value(name_box, -1)
+        get_modified_signal(name_box).connect(self._name_box_modified)
+
+        # Create a 'Delete'-button
+        del_but = self._create_entry_del_but()
+
+        # Create the initial (empty) value box
+        value_box = GW.QLabel()
+
+        # Add this entry to the grid and the row registry
+        self._insert_entry_row(del_but, name_box, value_box)
+
+    # This function adds a new entry that immediately uses the given name
+    def _add_entry_with_name(self, entry_name):
+        """
+        Adds a new entry to the entries box that immediately uses the given
+        `entry_name`, creating its value box with the proper type directly.
+
+        This skips the placeholder value box and the subsequent value box
+        replacement that setting the name of an empty entry would trigger,
+        which matters when :meth:`~set_box_value` rebuilds many entries.
+
+        """
+
+        # Create a combobox with the name of the entry
+        name_box = self._create_entry_name_box()
+
+        # Set the name of this entry before connecting its signals
+        set_box_value(name_box, entry_name)
+        get_modified_signal(name_box).connect(self._name_box_modified)
+
+        # Create a 'Delete'-button
+        del_but = self._create_entry_del_but()
+
+        # Obtain the value box class associated with this entry_name
+        if self.is_valid(name_box):
+            # If the given name is valid, obtain it from dict or use default
+            value_box_class = self.entry_types.get(entry_name,
+                                                   GW.LongGenericBox)
+        else:
+            # If invalid, use a label
+            value_box_class = GW.QLabel
+
+        # Create the value box of this entry directly
+        value_box = value_box_class()
+        value_box.setSizePolicy(QW.QSizePolicy.MinimumExpanding,
+                                QW.QSizePolicy.Fixed)
+
+        # Check if this entry is valid
+        if value_box_class is not GW.QLabel:
+            # If so, connect to modified signal
+            get_modified_signal(value_box).connect(self.modified)
+
+            # Modify tooltip
+            value_box.setToolTip(f"Set value for entry <b>{entry_name}</b>")
+
+            # If this entry has a default value, use it
+            if entry_name in self.entry_defaults:
+                set_box_value(value_box, self.entry_defaults[entry_name])
+        else:
+            # If not, set a warning as the value
+            set_box_value(value_box, f"Entry <b>{entry_name}</b> is either "
+                          "invalid or already in use!")
+
+        # Add this entry to the grid and the row registry
+        self._insert_entry_row(del_but, name_box, value_box)
+
+    # This function creates and returns the name box for a new entry
+    def _create_entry_name_box(self):
+        # Rebuild the cached tuple of entry type names if it is stale
+        if self._types_dirty:
+            self._entry_type_names = tuple(self.entry_types.keys())
+            self._types_dirty = False
+
         # Create a combobox with the name of the entry
         name_box = self.get_entry_name_box()
         name_box.setToolTip("Select or type name for this entry")
-        name_box.addItems(self.entry_types.keys())
-        set_box_value(name_box, -1)
-        get_modified_signal(name_box).connect(
-            lambda: self.create_value_box(name_box))
+        name_box._value_box_pool = {}
+        name_box.addItems(self._entry_type_names)
+
+        # Return name_box
+        return(name_box)
 
+    # This function creates and returns the delete button for a new entry
+    def _create_entry_del_but(self):
         # Create a 'Delete'-button
         del_but = GW.QToolButton()
         del_but.setFixedSize(self.entry_height, self.entry_height)
         del_but.setToolTip("Delete this entry")
-        get_modified_signal(del_but).connect(
-            lambda: self.remove_entry(name_box))
-
-        # If this theme has a 'remove' icon, use it
-        if QG.QIcon.hasThemeIcon('remove'):
-            del_but.setIcon(QG.QIcon.fromTheme('remove'))
-        # Else, use a standard icon
-        else:
-            del_but.setIcon(del_but.style().standardIcon(
-                QW.QStyle.SP_DialogCloseButton))
+        get_modified_signal(del_but).connect(self._del_but_clicked)
+
+        # Resolve the 'remove' icon once for all entries boxes
+        if EntriesBox._del_icon is None:
+            # If this theme has a 'remove' icon, use it
+            if QG.QIcon.hasThemeIcon('remove'):
+                EntriesBox._del_icon = QG.QIcon.fromTheme('remove')
+            # Else, use a standard icon
+            else:
+                EntriesBox._del_icon = del_but.style().standardIcon(
+                    QW.QStyle.SP_DialogCloseButton)
+
+        # Use this icon for the 'Delete'-button
+        del_but.setIcon(EntriesBox._del_icon)
+
+        # Return del_but
+        return(del_but)
+
+    # This function adds the given entry widgets to the layout and registry
+    def _insert_entry_row(self, del_but, name_box, value_box):
+        # Create the widget that holds this entry's row
+        row_widget = GW.QWidget()
+        row_layout = GL.QHBoxLayout(row_widget)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Add all entry widgets to it, using the same stretch as the header
+        row_layout.addWidget(del_but)
+        row_layout.addWidget(name_box, 1)
+        row_layout.addWidget(value_box, 2)
+
+        # Append this row to the entries layout
+        self.entries_layout.addWidget(row_widget)
+
+        # Register this entry in the row registry
+        # The name_box and del_but carry a reference to their own row, so the
+        # entry slots can recover their entry through self.sender()
+        row = [del_but, name_box, value_box]
+        name_box._entry_row = row
+        del_but._entry_row = row
+        self._rows.append(row)
+
+    # This slot creates the value box of the entry whose name was modified
+    @QC.Slot()
+    def _name_box_modified(self):
+        self.create_value_box(self.sender())
 
-        # Add a new row to the grid layout
-        next_row = self.entries_grid.getItemPosition(
-            self.entries_grid.count()-1)[0]+1
-        self.entries_grid.addWidget(del_but, next_row, 0)
-        self.entries_grid.addWidget(name_box, next_row, 1)
-        self.entries_grid.addWidget(GW.QLabel(), next_row, 2)
+    # This slot removes the entry whose delete button was clicked
+    @QC.Slot()
+    def _del_but_clicked(self):
+        self.remove_entry(self.sender()._entry_row[1])
 
     # This function is called whenever an entry must be removed
     @QC.Slot(GW.QComboBox)
@@ -320,17 +469,26 @@ class EntriesBox(GW.BaseBox):
         # Determine if name_box is valid
         valid = self.is_valid(name_box)
 
-        # Determine at what index the provided name_box currently is in grid
-        index = self.entries_grid.indexOf(name_box)
+        # Obtain the row of the provided name_box and remove it from registry
+        row = name_box._entry_row
+        self._rows.remove(row)
+
+        # Close all widgets in this row
+        for widget in row:
+            widget.close()
 
-        # As every entry contains 3 items, remove item 3 times at index-1
-        for _ in range(3):
-            # Remove the current item at index-1
-            item = self.entries_grid.takeAt(index-1)
+        # Close all pooled value boxes of this entry as well
+        for pooled_box in name_box._value_box_pool.values():
+            pooled_box.close()
 
-            # Close the widget in this item and delete it
-            item.widget().close()
-            del item
+        # Remove the widget holding this entire row from the entries layout
+        # Deletion is deferred to the event loop, so tearing down many rows
+        # does not block the current tick (and the row's widgets are actually
+        # destroyed instead of lingering as hidden children)
+        row_widget = name_box.parentWidget()
+        self.entries_layout.removeWidget(row_widget)
+        row_widget.close()
+        row_widget.deleteLater()
 
         # Emit modified signal if name_box was valid
         if valid:
@@ -352,14 +510,14 @@ class EntriesBox(GW.BaseBox):
         # Determine the current value of the name_box
         entry_name = get_box_value(name_box)
 
-        # Determine at what index the provided name_box currently is in grid
-        index = self.entries_grid.indexOf(name_box)
+        # Obtain the row of the provided name_box
+        row = name_box._entry_row
 
         # Check if the name_box is valid
         valid = self.is_valid(name_box)
 
         # Retrieve which value_box is currently there
-        cur_box = self.entries_grid.itemAt(index+1).widget()
+        cur_box = row[2]
 
         # Obtain the widget class associated with this entry_name
         if valid:
@@ -376,23 +534,36 @@ class EntriesBox(GW.BaseBox):
 
         # If the current value box is not this box type already, replace it
         if type(cur_box) is not new_box_class:
-            # If not, create new value box
-            new_box = new_box_class()
-            new_box.setSizePolicy(QW.QSizePolicy.MinimumExpanding,
-                                  QW.QSizePolicy.Fixed)
-
-            # Connect to modified signal
-            if valid:
-                get_modified_signal(new_box).connect(self.modified)
-
-            # Replace cur_box with new_box
-            item = self.entries_grid.replaceWidget(cur_box, new_box)
+            # Try to reuse a pooled value box of this type for this entry
+            # Reconstructing the widget on every name change is expensive and
+            # users regularly cycle back to a previously used entry type
+            pool = name_box._value_box_pool
+            new_box = pool.pop(new_box_class, None)
+
+            # If no such box exists yet, create a new one
+            if new_box is None:
+                new_box = new_box_class()
+                new_box.setSizePolicy(QW.QSizePolicy.MinimumExpanding,
+                                      QW.QSizePolicy.Fixed)
+
+                # Connect to modified signal
+                if valid:
+                    get_modified_signal(new_box).connect(self.modified)
+
+            # Replace cur_box with new_box in this entry's row layout
+            row_layout = name_box.parentWidget().layout()
+            row_layout.replaceWidget(cur_box, new_box)
+            row_layout.setStretchFactor(new_box, 2)
+            row[2] = new_box
+            new_box.show()
+
+            # Store the displaced box in the pool, capping the pool's size
+            if len(pool) >= 4:
+                pool.pop(next(iter(pool))).close()
+            pool[type(cur_box)] = cur_box
+            cur_box.hide()
             cur_box = new_box
 
-            # Close the widget in this item and delete it
-            item.widget().close()
-            del item
-
         # If the box is invalid, set its value
         if not valid:
             # If it has a name, set a warning as the value
@@ -469,6 +640,9 @@ class EntriesBox(GW.BaseBox):
         self.entry_types.update(types)
         self.entry_defaults.update(defaults)
 
+        # Mark the cached tuple of entry type names as stale
+        self._types_dirty = True
+
     # This function adds a dict of default values for given entries
     def addDefaults(self, entry_defaults):
         """
@@ -510,7 +684,7 @@ class EntriesBox(GW.BaseBox):
         """
 
         # Convert banned_names to a set
-        banned_names = sset(banned_names)
+        banned_names = set(banned_names)
 
         # Make sure that '' is not in banned_names
         banned_names.discard('')
@@ -525,6 +699,9 @@ class EntriesBox(GW.BaseBox):
         for banned_type in banned_types:
             self.entry_types.pop(banned_type)
 
+        # Mark the cached tuple of entry type names as stale
+        self._types_dirty = True
+
     # This function retrieves the values of the entries in this entries box
     def get_box_value(self, *value_sig):
         """
@@ -538,28 +715,29 @@ class EntriesBox(GW.BaseBox):
 
         """
 
+        # If the cached values are still valid, return a copy of them
+        # A copy is returned so callers cannot modify the cache itself
+        if self._cached_values is not None:
+            return(dict(self._cached_values))
+
         # Create an empty dict to hold the entry values in
         entries_dict = dict()
 
-        # Loop over all entries in the entries grid and save them to the dict
-        for i in range(4, 4+3*self.entryCount(), 3):
+        # Loop over all entries in the row registry and save them to the dict
+        for _, name_box, value_box in self._rows:
             # Obtain the name of this entry
-            name_box = self.entries_grid.itemAt(i).widget()
             entry_name = get_box_value(name_box)
 
             # If the entry_name is invalid, skip this entry
             if not self.is_valid(name_box):
                 continue
 
-            # Obtain the value of this entry
-            value_box = self.entries_grid.itemAt(i+1).widget()
-            entry_value = get_box_value(value_box)
-
             # Add this entry to the dict
-            entries_dict[entry_name] = entry_value
+            entries_dict[entry_name] = get_box_value(value_box)
 
-        # Return entries_dict
-        return(entries_dict)
+        # Save entries_dict in the cache and return a copy of it
+        self._cached_values = entries_dict
+        return(dict(entries_dict))
 
     # This function sets the values of the entries in this entries box
     def set_box_value(self, entries_dict, *value_sig):
@@ -575,50 +753,79 @@ class EntriesBox(GW.BaseBox):
 
         """
 
-        # Hide the entries box to allow for its values to be set properly
-        self.hide()
-
         # Remove all banned names from entries_dict
-        entries_dict = sdict({key: value for key, value in entries_dict.items()
-                              if key not in self.banned_names})
-
-        # Create empty dict for all current entries
-        cur_entries_dict = {}
+        # Sorting once here is much cheaper than maintaining sorted order on
+        # every insertion with a SortedDict
+        entries_dict = dict(
+            sorted((key, value) for key, value in entries_dict.items()
+                   if key not in self.banned_names))
+
+        # If these entries equal the current state, nothing needs to be done
+        # The entry count is compared as well, as invalid entries do not show
+        # up in get_box_value but would be removed by a rebuild
+        if(len(entries_dict) == self.entryCount() and
+           entries_dict == EntriesBox.get_box_value(self)):
+            return
 
-        # Remove all entries from the entries box
-        for _ in range(self.entryCount()):
-            # Obtain the name of the next entry
-            name_box = self.entries_grid.itemAt(4).widget()
-            entry_name = get_box_value(name_box)
-
-            # Delete this entry if it is not in entries_dict or it is invalid
-            if entry_name not in entries_dict or not self.is_valid(name_box):
-                self.remove_entry(name_box)
-                continue
-
-            # Add this entry to cur_entries_dict
-            cur_entries_dict[entry_name] =\
-                [self.entries_grid.takeAt(3) for _ in range(3)]
-
-        # Add all entries in entries_dict
-        for row, (entry_name, entry_value) in enumerate(entries_dict.items(),
-                                                        1):
-            # Check if this entry_name is in cur_entries_dict
-            if entry_name in cur_entries_dict:
-                # If so, put it back into the entries box
-                for col, item in enumerate(cur_entries_dict.pop(entry_name)):
-                    self.entries_grid.addItem(item, row, col)
-            else:
-                # If not, add a new empty entry to the entries box
-                self.add_entry()
+        # Hide the entries box to allow for its values to be set properly
+        self.hide()
 
-                # Set the name of this entry
-                name_box = self.entries_grid.itemAtPosition(row, 1).widget()
-                set_box_value(name_box, entry_name)
+        # Suppress widget updates and this box's own signals while modifying
+        # Every individual entry change would otherwise trigger a relayout
+        # plus a 'modified' emission (and thus a full get_box_value call)
+        self.setUpdatesEnabled(False)
+        blocked = self.blockSignals(True)
 
-            # Set the value of this entry
-            value_box = self.entries_grid.itemAtPosition(row, 2).widget()
-            set_box_value(value_box, entry_value)
+        try:
+            # Create empty dict for all current entries
+            cur_entries_dict = {}
+
+            # Remove all entries from the entries box
+            for entry_row in list(self._rows):
+                # Obtain the name of this entry
+                name_box = entry_row[1]
+                entry_name = get_box_value(name_box)
+
+                # Delete this entry if not in entries_dict or it is invalid
+                if(entry_name not in entries_dict or
+                   not self.is_valid(name_box)):
+                    self.remove_entry(name_box)
+                    continue
+
+                # Detach this entry's row widget and registry row for re-use
+                row_widget = name_box.parentWidget()
+                self.entries_layout.removeWidget(row_widget)
+                cur_entries_dict[entry_name] = (entry_row, row_widget)
+                self._rows.remove(entry_row)
+
+            # Add all entries in entries_dict
+            for entry_name, entry_value in entries_dict.items():
+                # Check if this entry_name is in cur_entries_dict
+                if entry_name in cur_entries_dict:
+                    # If so, put it back into the entries box and registry
+                    entry_row, row_widget = cur_entries_dict.pop(entry_name)
+                    self.entries_layout.addWidget(row_widget)
+                    self._rows.append(entry_row)
+                else:
+                    # If not, add a new entry using this name directly
+                    # This creates the value box with the proper type at once
+                    # instead of replacing a placeholder box afterwards
+                    self._add_entry_with_name(entry_name)
+                    entry_row = self._rows[-1]
+
+                # Set the value of this entry
+                # The row registry is read after the name was set, as setting
+                # the name replaces the value box of the entry
+                set_box_value(entry_row[2], entry_value)
+        finally:
+            # Restore signals and updates, and recompute the layout once
+            self.blockSignals(blocked)
+            self.setUpdatesEnabled(True)
+            self.entries_layout.activate()
+            self.updateGeometry()
+
+        # Emit modified signal once for the entire batch of changes
+        self.modified.emit()
 
         # Show the entries box again now that its values have been set
         self.show()
@@ -24,6 +24,15 @@ __all__ = ['LineStyleBox', 'MarkerStyleBox']
 # %% CLASS DEFINITIONS
 # Make class for setting the linestyle
 class LineStyleBox(GW.QComboBox):
+    # Class attributes
+    # Tuple of all supported linestyles, computed once at import time
+    # A hard-coded literal is avoided on purpose, as the set must track the
+    # lineStyles table of the installed matplotlib version
+    LINESTYLES = tuple(sorted(
+        [(key, value[6:]) for key, value in lineStyles.items()
+         if value != '_draw_nothing'] + [('', 'nothing')],
+        key=lambda x: x[0]))
+
     def __init__(self, *args, **kwargs):
         # Call super constructor
         super().__init__(*args, **kwargs)
@@ -33,21 +42,19 @@ class LineStyleBox(GW.QComboBox):
 
     # This function sets up the linestyle box
     def init(self):
-        # Obtain list with all supported linestyles if not existing already
-        if not hasattr(self, 'LINESTYLES'):
-            # Create list of all supported linestyles
-            linestyles = [(key, value[6:]) for key, value in lineStyles.items()
-                          if value != '_draw_nothing']
-            linestyles.append(('', 'nothing'))
-            linestyles.sort(key=lambda x: x[0])
-
-            # Save as class attribute
-            LineStyleBox.LINESTYLES = linestyles
-
-        # Populate this box with all supported linestyles
+        # Populate this box with all supported linestyles in a single batch
+        # Blocking the model signals and widget updates while adding prevents
+        # a view relayout for every individual item
+        self.setUpdatesEnabled(False)
+        blocked = self.model().blockSignals(True)
         for i, (linestyle, tooltip) in enumerate(self.LINESTYLES):
             self.addItem(linestyle)
             self.setItemData(i, tooltip, QC.Qt.ToolTipRole)
+        self.model().blockSignals(blocked)
+
+        # Notify the view of the new items and re-enable updates
+        self.model().layoutChanged.emit()
+        self.setUpdatesEnabled(True)
 
         # Set initial value to the default value in MPL
         set_box_value(self, rcParams['lines.linestyle'])
@@ -68,6 +75,15 @@ class LineStyleBox(GW.QComboBox):
 
 # Make class for setting the markerstyle
 class MarkerStyleBox(GW.QComboBox):
+    # Class attributes
+    # Tuple of all supported markerstyles, computed once at import time
+    # This avoids rebuilding, filtering and sorting the list on the creation
+    # of every new markerstyle box
+    MARKERS = tuple(sorted(
+        [(key, value) for key, value in lineMarkers.items()
+         if(value != 'nothing' and isinstance(key, str))] + [('', 'nothing')],
+        key=lambda x: x[0]))
+
     def __init__(self, *args, **kwargs):
         # Call super constructor
         super().__init__(*args, **kwargs)
@@ -77,21 +93,21 @@ class MarkerStyleBox(GW.QComboBox):
 
     # This function sets up the markerstyle box
     def init(self):
-        # Obtain list with all supported markerstyles if not existing already
-        if not hasattr(self, 'MARKERS'):
-            # Create list of all supported markerstyles
-            markers = [(key, value) for key, value in lineMarkers.items()
-                       if(value != 'nothing' and isinstance(key, str))]
-            markers.append(('', 'nothing'))
-            markers.sort(key=lambda x: x[0])
-
-            # Save as class attribute
-            MarkerStyleBox.MARKERS = markers
-
-        # Populate this box with all supported markerstyles
+        # Build an off-screen model with all supported markerstyles
+        # Replacing the model in a single call updates the view once, instead
+        # of once for every added item
+        model = QG.QStandardItemModel(len(self.MARKERS), 1, self)
         for i, (marker, tooltip) in enumerate(self.MARKERS):
-            self.addItem(marker)
-            self.setItemData(i, tooltip, QC.Qt.ToolTipRole)
+            item = QG.QStandardItem(marker)
+            item.setToolTip(tooltip)
+            model.setItem(i, 0, item)
+
+        # Use this model for this box
+        self.setModel(model)
+
+        # Avoid measuring every item for the size hint on first display
+        self.setSizeAdjustPolicy(self.AdjustToMinimumContentsLengthWithIcon)
+        self.setMinimumContentsLength(12)
 
         # Set initial value to the default value in MPL
         set_box_value(self, rcParams['lines.marker'])